@@ -13,6 +13,9 @@ Create a comprehensive basket_types.py file that serves as the core data structu
    - Required columns: ISIN, sector, rating, duration, liquidity_score, amount_outstanding
    - Optional columns: price, yield, duration_bucket, maturity_date
    - Data type specifications and validation rules
+   - dtypes declares rating, sector and duration_bucket as pandas categoricals (RATING_CDTYPE, SECTOR_CDTYPE, DURATION_BUCKET_CDTYPE), never object strings
+   - ISIN is declared as ISIN_DTYPE (pd.ArrowDtype(pa.string()) when pyarrow is available) so equality lookups run as vectorized Arrow kernels; sector stays categorical
+   - Numeric columns use NUMERIC_DTYPES: duration, liquidity_score, price, yield as float32; amount_outstanding as nullable Int64; dtypes includes NUMERIC_DTYPES; the cast only applies entries whose column is present, since price/yield/duration_bucket are optional
 
 2. **BasketInput dataclass** - Structured input for basket construction:
    - universe: pd.DataFrame
@@ -20,30 +23,64 @@ Create a comprehensive basket_types.py file that serves as the core data structu
    - filters: Dict[str, Any]
    - weighting_method: enum
    - constraints: ConstraintConfig
+   - __post_init__ validates universe column-at-a-time, never row-by-row (no iterrows/apply):
+     - missing required columns are collected first as required.difference(df.columns); the row checks then run only on the present columns, so an absent column never surfaces as a KeyError from df[required]
+     - row completeness via df[present].notna().all(axis=1).values (one bool per row)
+     - rating domain via np.isin(df['rating'].values, VALID_RATINGS_ARR)
+     - duration range via df['duration'].between(0.0, MAX_DURATION).values (inclusive, years)
+   - All failing checks raise one aggregated ValueError listing the missing column names and, per row check, the offending row positions (np.where(~row_mask)[0])
 
 3. **BasketOutput dataclass** - Structured output with metadata:
    - basket_id: str
-   - constituents: pd.DataFrame with weights
+   - constituents: Constituents, a NamedTuple of NumPy arrays (isin, weight, sector_codes, rating_codes, duration, liquidity_score, amount_outstanding) rather than a DataFrame
+     - every field is a plain np.ndarray; isin is taken from the Arrow-backed column with .to_numpy(dtype=object) at construction, so no ExtensionArray ever reaches Constituents
+   - Invariant: constituents rows are sorted by sector code (stable, so ties keep selection order)
+   - constituents_df: property that materializes pd.DataFrame({'ISIN': self.constituents.isin, 'weight': self.constituents.weight, 'sector': pd.Categorical.from_codes(self.constituents.sector_codes, dtype=SECTOR_CDTYPE), 'rating': pd.Categorical.from_codes(self.constituents.rating_codes, dtype=RATING_CDTYPE), ...}) only when accessed, for user-facing output; sector and rating come back as categoricals, not raw int16 codes
    - metadata: comprehensive basket statistics
    - quality_metrics: risk and diversification measures
-   - warnings: List[str]
+   - warnings: List[str] (validators extend it from masks, capped at MAX_WARNINGS per check)
+   - __post_init__ validates constituents with the same vectorized masks as BasketInput, applied to the Constituents arrays (all same length, weights finite and non-negative, and (sector_codes >= 0).all() & (rating_codes >= 0).all(), since a missing sector/rating is code -1 and np.bincount rejects negative input)
 
 4. **Filter enums and validation**:
    - SectorFilter, RatingFilter, DurationFilter classes
    - FilterValidator for input validation
+     - dispatches through a module-level FILTER_HANDLERS: Dict[str, Callable[[Any], None]] = {'sector': SectorFilter.validate, 'rating': RatingFilter.validate, 'duration': DurationFilter.validate, 'duration_bucket': DurationFilter.validate_bucket, 'reference_isin': _validate_reference_isin}, built once at import
+     - the keys match the filter names ConfigValidator requires per basket type (sector, rating, duration_bucket, reference_isin)
+     - DurationFilter.validate_bucket checks the value is in BUCKET_LABELS; _validate_reference_isin checks the value is a non-empty str
+     - validate(filters) is a single loop: for key, value in filters.items(): FILTER_HANDLERS[key](value); unknown keys raise ValueError naming the supported filters
+     - none of the handlers needs schema context (they check against module constants such as VALID_RATINGS and BUCKET_LABELS), so the table is safe to build at import; no isinstance/if-key chains
    - Business rule constraints
 
 5. **Constants and mappings**:
    - VALID_RATINGS: Rating hierarchy and categories
+     - an ordered tuple, best first: ('AAA', 'AA+', 'AA', 'AA-', 'A+', 'A', 'A-', 'BBB+', ..., 'CCC', 'CC', 'C', 'D'); never a set, because the tuple order defines rating rank (AAA = 0)
+   - VALID_RATINGS_ARR: np.array(sorted(VALID_RATINGS), dtype='U8'), precomputed at import for np.isin checks
    - SECTOR_MAPPINGS: Sector standardization
    - DURATION_BUCKETS: Duration bucket definitions
+     - DURATION_EDGES = np.array([0, 3, 7, 15, np.inf], dtype=np.float32) and BUCKET_LABELS = ['ultra_short', 'short', 'medium', 'long']
+     - SIZE_EDGES = np.array([0, 250e6, 500e6, 1e9, np.inf], dtype=np.float64) and SIZE_LABELS = ['small', 'medium', 'large', 'jumbo'] for amount_outstanding (face value, currency units); SIZE_CDTYPE = CategoricalDtype(SIZE_LABELS, ordered=True)
    - DEFAULT_CONSTRAINTS: Default limits and thresholds
+   - ISIN_DTYPE: pd.ArrowDtype(pa.string()) if pa else object, resolved once at import from an optional `try: import pyarrow as pa / except ImportError: pa = None`; the module imports cleanly without pyarrow
+   - MAX_DURATION: 50.0, upper bound (years) for the duration range check
+   - MAX_WARNINGS: 100, cap on per-check warning messages
+   - NUMERIC_DTYPES: {'duration': np.float32, 'liquidity_score': np.float32, 'price': np.float32, 'yield': np.float32, 'amount_outstanding': pd.Int64Dtype()} (nullable, so missing amounts survive the cast until the missing-data strategy runs; Constituents take .to_numpy(np.int64) once rows are clean)
+   - RATING_CDTYPE: CategoricalDtype(VALID_RATINGS, ordered=True), so rating order is the category order
+   - RATING_RANK: {rating: i for i, rating in enumerate(VALID_RATINGS)}, for the external API only; internal code compares RATING_CDTYPE codes, never dict lookups per row
+   - SECTOR_CDTYPE: CategoricalDtype(sorted(set(SECTOR_MAPPINGS.values()))); several raw names map to one standard sector, and categories must be unique
+   - DURATION_BUCKET_CDTYPE: CategoricalDtype(BUCKET_LABELS, ordered=True)
 
 **Technical Requirements:**
-- Use Python 3.9+ features (dataclasses, type hints, enums)
+- Use Python 3.10+ features (dataclasses, type hints, enums)
+- Declare TradingSchema, BasketInput, BasketOutput, DataQualityReport and ConstraintConfig as @dataclass(slots=True, frozen=True); no per-instance __dict__
+  - DataQualityReport is frozen, so its stages (validate_range, out-of-range bucket codes, duplicate ISINs, validate_universe_quality) write into local arrays/lists inside process_universe, and the report is constructed once at the end; no stage mutates a report after it is built
 - Include comprehensive validation with meaningful error messages
 - Support serialization to/from JSON for configuration persistence
-- Implement __post_init__ validation in dataclasses
+  - to_json(self) -> bytes: orjson.dumps(self, default=_default, option=orjson.OPT_SERIALIZE_NUMPY), so dataclasses and ndarrays serialize without asdict()/.tolist() copies
+  - _default handles enums (.value), sets (sorted list), DataFrames (to_dict('list')), NamedTuples such as Constituents (._asdict(); orjson only serializes exact tuples) and ndarrays orjson cannot serialize natively, such as the object-dtype Constituents.isin and str col_names (.tolist())
+  - _default also serializes the dtypes in TradingSchema.dtypes: CategoricalDtype -> {'categories': list(categories), 'ordered': ordered}, pd.ArrowDtype -> "arrow:" + str(pyarrow_dtype) (e.g. "arrow:string"), and other dtypes or NumPy scalar types (np.float32, pd.Int64Dtype()) -> str(pd.api.types.pandas_dtype(t)) (e.g. "float32", "Int64")
+  - from_json(cls, data: bytes) classmethod: orjson.loads, then rebuild enums from values, sets from lists, Constituents arrays with their declared dtypes (np.float32, int16 codes, object-dtype isin) and DataFrames via pd.DataFrame(...).astype(schema.dtypes); round-trips through to_json
+  - TradingSchema.from_json rebuilds dtypes: dicts -> CategoricalDtype(categories, ordered), "arrow:<type>" -> pd.ArrowDtype(pa.type_for_alias(type)) (object when pyarrow is missing, matching ISIN_DTYPE), anything else -> pd.api.types.pandas_dtype(name)
+- Implement __post_init__ validation in dataclasses using vectorized NumPy/pandas masks (must stay fast on 100k+ bond universes)
 - Use Pydantic-style validation patterns where appropriate
 
 The file should be the single source of truth for all data structures used across the basket construction system.
@@ -64,20 +101,47 @@ Refactor data_prep_basket.py to implement a TradingSchema-based data preparation
    - Check required columns, data types, value ranges
    - Generate DataQualityReport with detailed validation results
    - Handle missing data strategies (drop, fill, warn)
+   - Warnings are built from vectorized masks, never by appending inside a row loop:
+     - check_rating_domain: bad = ~df['rating'].isin(VALID_RATINGS).values; idx = np.flatnonzero(bad)[:MAX_WARNINGS]; then warnings.extend(f"Bond {isin}: invalid rating {r}" for isin, r in zip(df['ISIN'].values[idx], df['rating'].values[idx]))
+     - runs on the raw strings, before the categorical cast turns unknown ratings into NaN
+     - only the sliced idx rows are formatted (at most MAX_WARNINGS, 100, per check), so message building stays O(MAX_WARNINGS) on pathological inputs, followed by one "... and N more" summary line
 
 2. **UniverseFilter** (TradingSchema-based):
    - filter_by_schema(df, schema) -> apply base trading rules
    - filter_by_liquidity_percentile(df, min_percentile) 
    - filter_by_sector(df, allowed_sectors)
    - filter_by_rating_range(df, min_rating, max_rating)
+     - convert bounds once via RATING_CDTYPE.categories.get_indexer([min_rating, max_rating]); a -1 in the result means an unknown rating, so raise ValueError naming the bad bound (otherwise lo = -1 would admit NaN-rated rows)
+     - normalize with lo, hi = sorted(bounds), so that with best-first codes min_rating='BBB-', max_rating='AAA' still selects AAA..BBB- instead of an empty mask; then codes = df['rating'].cat.codes.values and return (codes >= lo) & (codes <= hi) as an np.ndarray[bool] for compose()
    - filter_for_similarity(df, reference_isin, criteria) -> similarity constraints
+     - compares all candidates to the reference in one array pass; no df.apply(axis=1)
    - Each method should preserve schema compliance
+   - Each filter is a pure predicate (df, mask_so_far) -> np.ndarray[bool] computed from the unsliced df columns; most predicates ignore mask_so_far
+   - compose(df, *predicates) -> np.ndarray[bool]: starts from mask = np.ones(len(df), dtype=bool) and, in the order given, does mask &= predicate(df, mask), so each predicate sees the running mask
+   - filter_by_liquidity_percentile is order-dependent: it uses mask_so_far and computes the threshold as np.nanpercentile(liq[mask_so_far], min_percentile), i.e. over bonds that passed the earlier schema/sector/rating filters, exactly as the unfused chain did
+     - when mask_so_far is all False, it returns np.zeros(len(df), dtype=bool) without calling np.nanpercentile (which would return NaN with a RuntimeWarning on the empty slice)
+   - compose_query(schema, filters) -> str: joins the numeric predicates into one expression, e.g. "(liquidity_score >= @q) & (duration >= @dur_lo) & (duration <= @dur_hi)"
+     - @q is the liquidity threshold computed from liq[mask_so_far] after the schema, sector and rating masks, never over the raw universe
+     - evaluated with df.eval(expr, engine='numexpr', local_dict={...}).values so numexpr fuses the comparisons, and the result feeds compose() like any other mask
+     - categorical predicates (rating, sector) stay as code-compare masks and are not put in the expression; numexpr cannot evaluate .between/.isin
+     - use engine='python' when numexpr is not installed
 
 3. **BondDataProcessor** (main orchestrator):
-   - process_universe(raw_df, trading_schema) -> (clean_df, quality_report)
+   - process_universe(raw_df, trading_schema) -> (indexed_universe: IndexedUniverse, quality_report)
+     - builds mask = UniverseFilter.compose(...) over the whole chain and slices once: clean_df = df.loc[mask].copy(), returned as indexed_universe.df
+     - no intermediate filtered DataFrames between filter steps
    - standardize_to_schema(df, schema) -> apply column mappings and types
+     - types are applied in one df.astype({c: t for c, t in schema.dtypes.items() if c in df.columns}) call; pandas raises KeyError for dtype-mapping keys that are not columns, so absent optional columns (price, yield, duration_bucket) are skipped
+     - rating/sector come out as categorical columns whose .cat.codes are small integers; duration_bucket gets DURATION_BUCKET_CDTYPE where it is derived, in enrich_with_derived_features
+     - the ISIN -> row position lookup is built once per processed universe as IndexedUniverse.isin_index and reused across similarity calls
+     - validate_range step after the cast keeps two separate counts in the DataQualityReport:
+       - missing: rows already NaN before the cast (handled by the drop/fill/warn strategy)
+       - overflow: rows finite before the cast but not np.isfinite after downcasting to float32
    - validate_universe_quality(df) -> comprehensive data quality checks
    - enrich_with_derived_features(df) -> add computed columns (rating_category, size_bucket, etc.)
+     - duration_bucket in one vectorized call: codes = np.searchsorted(DURATION_EDGES, df['duration'].values, side='right') - 1, then pd.Categorical.from_codes(codes, dtype=DURATION_BUCKET_CDTYPE); no .apply(lambda ...)
+     - codes outside the label range (negative, NaN or inf durations) are set to -1 first so they become missing, and are reported in the DataQualityReport
+     - size_bucket uses the same searchsorted trick on amt = df['amount_outstanding'].to_numpy(np.float64, na_value=np.nan), since the nullable Int64 column would otherwise become an object array holding pd.NA; missing or out-of-range amounts map to code -1 as for durations, then pd.Categorical.from_codes(codes, dtype=SIZE_CDTYPE)
 
 4. **DataQualityReport dataclass**:
    - Schema compliance metrics
@@ -85,6 +149,18 @@ Refactor data_prep_basket.py to implement a TradingSchema-based data preparation
    - Outlier detection results  
    - Data type conversion issues
    - Actionable recommendations for data quality improvement
+   - Per-column metrics are parallel arrays, not a dict of dicts: col_names: np.ndarray[str], missing_count: np.ndarray[int32], missing_pct: np.ndarray[float32], outlier_count: np.ndarray[int32]
+   - validate_universe_quality fills them in one shot, all aligned to col_names = df.columns.to_numpy(str):
+     - missing_count = df.isna().sum(axis=0).to_numpy(np.int32)
+     - missing_pct = (missing_count / len(df) * 100).astype(np.float32) when len(df) > 0, else np.zeros(len(df.columns), np.float32) for an empty frame
+     - outlier_count = ((df[num_cols] - df[num_cols].mean()).abs() > 3 * df[num_cols].std()).sum(axis=0).reindex(df.columns, fill_value=0).to_numpy(np.int32), so non-numeric columns get 0 and the array stays parallel to col_names
+
+5. **IndexedUniverse dataclass**:
+   - df: pd.DataFrame (the clean universe)
+   - by_sector, by_rating, by_duration_bucket: Dict[str, np.ndarray] of row positions per value
+   - Built once in process_universe via df.groupby(col, observed=True).indices, which returns position arrays without copying the frame
+   - isin_index: Dict[str, np.int64] = dict(zip(df['ISIN'].values, np.arange(len(df), dtype=np.int64))), for O(1) reference-ISIN lookups
+     - dict(zip(...)) would silently keep the last position of a duplicated ISIN, so check df['ISIN'].is_unique first; if not, list the duplicates (df.loc[df['ISIN'].duplicated(keep=False), 'ISIN'], capped at MAX_WARNINGS) in the DataQualityReport and raise ValueError naming them
 
 **Integration Points:**
 - Use BasketInput.universe as the primary data container
@@ -114,6 +190,9 @@ Implement basket_construction.py as the core business logic layer that uses data
    - EqualWeightStrategy: weights = 1/n for all positions
    - AmountOutstandingWeightStrategy: weights ∝ amount_outstanding
    - LiquidityWeightStrategy: weights ∝ liquidity_score with power parameter
+     - __init__ binds self._power_fn once: a float32 copy (np.array(x, dtype=np.float32)) when power == 1.0, else lambda x: np.power(x, power, dtype=np.float32)
+     - compute(bonds): w = self._power_fn(bonds['liquidity_score'].values); w /= w.sum() in place, with no DataFrame round-trip and never writing into the universe's own array
+     - falls back to equal weights when the sum is zero, as the other strategies do; with n == 0 it returns np.empty(0, np.float32) instead of computing 1/n
    - CustomWeightStrategy: user-defined weighting function
    - Each strategy validates required columns and handles edge cases
 
@@ -123,140 +202,68 @@ Implement basket_construction.py as the core business logic layer that uses data
    - Apply weighting strategy from basket_input.weighting_method
    - Validate constraints from basket_input.constraints
    - Generate comprehensive BasketOutput with metadata
+   - Sort constituents once by sector after construction (np.argsort(sector_codes, kind='stable')) so the BasketOutput.constituents invariant holds
 
 3. **Specialized basket builders**:
    - SectorBasketBuilder(universe, sector, size_limit)
    - SectorRatingBasketBuilder(universe, sector, rating, size_limit)  
    - SectorRatingDurationBasketBuilder(universe, sector, rating, duration_bucket, size_limit)
-   - SimilarityBasketBuilder(universe, reference_isin, similarity_params)
+   - Builders accept an IndexedUniverse and subset by position instead of scanning: universe.df.take(universe.by_sector.get(sector, EMPTY_POS))
+     - EMPTY_POS = np.empty(0, dtype=np.int64); a sector, rating or bucket absent from the universe yields an empty candidate set (reported via the usual insufficient-bonds warning), never a KeyError
+   - Combined keys intersect position arrays: np.intersect1d(by_sector.get(s, EMPTY_POS), by_rating.get(r, EMPTY_POS), assume_unique=True), with by_duration_bucket added for the three-key builder
+   - SimilarityBasketBuilder(universe: IndexedUniverse, reference_isin, similarity_params)
 
 4. **SimilarityMatcher**:
-   - find_similar_bonds(universe, reference_isin, criteria) -> filtered DataFrame
+   - find_similar_bonds(universe: IndexedUniverse, reference_isin, criteria) -> filtered DataFrame (rows of universe.df)
    - calculate_similarity_scores() using duration, rating, sector, liquidity
+     - ref = universe.df.iloc[universe.isin_index[reference_isin]] (an O(1) lookup, no ISIN scan; unknown ISINs raise ValueError naming the ISIN), then one score array from .values columns:
+       w_dur * np.abs(dur - ref.duration) / dur_scale + w_rat * (rating_codes != ref_rating_code) + w_sec * (sector_codes != ref_sector_code) + w_liq * np.abs(liq - ref.liquidity_score)
+     - Returns a float32 ndarray aligned to the universe; no per-row SimilarityScore instances
+     - The reference bond is excluded before ranking with score[ref_pos] = np.inf, so it never scores 0 against itself and never ranks first (same rule as isin != reference_isin in the Architecture Overview)
+     - The weighted sum runs in a module-level _score kernel compiled with numba @njit(parallel=True, cache=True) (no fastmath, so the kernel does not reassociate or contract into FMA), looping with prange over candidates so no temporaries are allocated
+     - _score(dur, dur_ref, rat, rat_ref, sec, sec_ref, liq, liq_ref, w) takes contiguous float32 duration/liquidity and int16 code arrays; w is float32 with dur_scale already folded into w[0]
+     - find_similar_bonds casts inputs once (np.ascontiguousarray(..., dtype=np.float32) / int16) before calling the kernel
+     - numba is optional: if the import fails, fall back to the NumPy expression above; both paths agree within float32 rounding (np.allclose(a, b, rtol=1e-6)), which is the contract tests should check rather than exact equality
    - apply_similarity_constraints() with tolerance parameters
    - rank_by_similarity() for final selection
+     - top-K via np.argpartition(score, k)[:k], then sort only those k entries
+     - when k >= len(score), np.argpartition raises, so use np.argsort(score) directly; the excluded reference (score inf) is always dropped from the result
 
 5. **ConstraintValidator**:
    - validate_basket_constraints(constituents, weights, constraints) -> violations list
    - Check size limits, concentration limits, diversification requirements
    - Generate actionable constraint violation messages
    - Suggest remediation strategies
+   - n == 0 (e.g. an absent sector/rating/bucket yielding an empty candidate set) short-circuits to the single min_basket_size violation with the insufficient-bonds message, before any .max() on an empty array or 1.0 / hhi with hhi == 0
+   - Otherwise all checks come from one pass over the Constituents arrays: n = len(w), max_w = w.max(), hhi = w @ w, sector_w = np.bincount(sector_codes, weights=w), rating_w = np.bincount(rating_codes, weights=w)
+   - Per-bond constraints are mask rows from the same pass, each reduced to an offending-bond count:
+     - n_bad_liq = (liquidity_score < min_liquidity_score).sum()
+     - n_bad_sector = (~np.isin(sector_codes, allowed_sector_codes)).sum(), and n_bad_rating likewise for allowed_ratings (allowed sets converted to codes once via SECTOR_CDTYPE/RATING_CDTYPE categories.get_indexer)
+     - n_bad_duration = (~((duration >= lo) & (duration <= hi))).sum() for duration_range
+   - values = np.array([max_w, sector_w.max(), rating_w.max(), n, -n, -1.0 / hhi, n_bad_liq, n_bad_sector, n_bad_rating, n_bad_duration]) is compared once against limits built from ConstraintConfig (max_single_weight, max_sector_weight, max_rating_weight, max_basket_size, -min_basket_size, -min_effective_n, 0, 0, 0, 0); minimum limits are negated so every check is values > limits
+   - Unset optional constraints never fire: min_effective_n=None is treated as -inf (negated limit +inf); unset min_liquidity_score/allowed_sectors/allowed_ratings/duration_range set their count limit to +inf
+   - violations = np.where(values > limits)[0], mapped to precomputed message/remediation templates; no per-constraint if/raise
 
 6. **QualityMetricsCalculator**:
    - calculate_portfolio_metrics(constituents, weights) -> comprehensive metrics dict
    - Duration, sector, rating diversification measures
    - Concentration metrics (Herfindahl index, effective N positions)
    - Liquidity and size distribution statistics
+   - Computed with NumPy, not Python loops over groups: hhi = np.dot(w, w), effective_n = 1.0 / hhi
+   - Sector/rating diversification via np.bincount(codes, weights=w, minlength=len(SECTOR_CDTYPE.categories)) on the categorical codes, then sector_hhi = sector_weights @ sector_weights (same for ratings with RATING_CDTYPE)
+   - Consumes the Constituents arrays directly (no DataFrame round-trip): np.dot(c.weight, c.weight), np.bincount(c.sector_codes, weights=c.weight); avoid groupby(...)['weight'].sum() here
+   - Any remaining groupby over constituents_df passes sort=False, observed=True; keys are categorical and already sorted, so pandas takes the sorted-key path without materializing unused categories
+   - Memoized per instance, never through module-level state: QualityMetricsCalculator.__init__(universe) binds self._cached_metrics = functools.lru_cache(maxsize=1024)(self._metrics_core)
+     - the public method passes tuple(constituents.isin) plus the raw bytes of every numeric Constituents array (weight, sector_codes, rating_codes, duration, liquidity_score, amount_outstanding) as the key, so the key carries all the data the metrics need and no ISIN-by-ISIN lookup through isin_index is ever made
+     - _metrics_core rebuilds each array with np.frombuffer(buf, dtype=...) using the fixed Constituents dtypes (float32 weight/duration/liquidity_score, int16 codes, int64 amount_outstanding), then runs the vectorized np.dot/np.bincount code above
+     - the cache lives on the instance, so two live BasketConstructors (each owning its own calculator) never share entries
+     - return copy.deepcopy(...) of the cached dict so callers cannot mutate cache entries or their nested arrays/dicts
+     - a new universe means a new BasketConstructor and a new calculator, so there is no global cache_clear()
 
 **Method Signatures:**
 ```python
 def build_basket(basket_input: BasketInput) -> BasketOutput:
 def calculate_weights(bonds: pd.DataFrame, method: WeightingMethod, **params) -> pd.Series:
-def find_similar_bonds(universe: pd.DataFrame, reference_isin: str, config: SimilarityConfig) -> pd.DataFrame:
+def find_similar_bonds(universe: IndexedUniverse, reference_isin: str, config: SimilarityConfig) -> pd.DataFrame:
 def validate_constraints(basket_output: BasketOutput) -> List[ConstraintViolation]:
-
-Implement basket_construction.py as the core business logic layer that uses data structures from basket_types.py and processes data from data_prep_basket.py.
-
-**Architecture Requirements:**
-- Import and use BasketInput, BasketOutput, and other data classes from basket_types
-- Implement Strategy pattern for different weighting methods
-- Use composition with clear separation of concerns
-- All methods should accept/return structured data classes
-
-**Key Components to Implement:**
-
-1. **WeightingStrategy ABC and implementations**:
-   - EqualWeightStrategy: weights = 1/n for all positions
-   - AmountOutstandingWeightStrategy: weights ∝ amount_outstanding
-   - LiquidityWeightStrategy: weights ∝ liquidity_score with power parameter
-   - CustomWeightStrategy: user-defined weighting function
-   - Each strategy validates required columns and handles edge cases
-
-2. **BasketConstructor** (main orchestrator):
-   - build_basket(basket_input: BasketInput) -> BasketOutput
-   - Delegate to specialized builders based on basket_input.basket_type
-   - Apply weighting strategy from basket_input.weighting_method
-   - Validate constraints from basket_input.constraints
-   - Generate comprehensive BasketOutput with metadata
-
-3. **Specialized basket builders**:
-   - SectorBasketBuilder(universe, sector, size_limit)
-   - SectorRatingBasketBuilder(universe, sector, rating, size_limit)  
-   - SectorRatingDurationBasketBuilder(universe, sector, rating, duration_bucket, size_limit)
-   - SimilarityBasketBuilder(universe, reference_isin, similarity_params)
-
-4. **SimilarityMatcher**:
-   - find_similar_bonds(universe, reference_isin, criteria) -> filtered DataFrame
-   - calculate_similarity_scores() using duration, rating, sector, liquidity
-   - apply_similarity_constraints() with tolerance parameters
-   - rank_by_similarity() for final selection
-
-5. **ConstraintValidator**:
-   - validate_basket_constraints(constituents, weights, constraints) -> violations list
-   - Check size limits, concentration limits, diversification requirements
-   - Generate actionable constraint violation messages
-   - Suggest remediation strategies
-
-6. **QualityMetricsCalculator**:
-   - calculate_portfolio_metrics(constituents, weights) -> comprehensive metrics dict
-   - Duration, sector, rating diversification measures
-   - Concentration metrics (Herfindahl index, effective N positions)
-   - Liquidity and size distribution statistics
-
-**Method Signatures:**
-```python
-def build_basket(basket_input: BasketInput) -> BasketOutput:
-def calculate_weights(bonds: pd.DataFrame, method: WeightingMethod, **params) -> pd.Series:
-def find_similar_bonds(universe: pd.DataFrame, reference_isin: str, config: SimilarityConfig) -> pd.DataFrame:
-def validate_constraints(basket_output: BasketOutput) -> List[ConstraintViolation]:
-
-Refactor data_prep_basket.py to implement a TradingSchema-based data preparation pipeline that integrates with the data structures defined in basket_types.py.
-
-**Architecture Requirements:**
-- Import and use TradingSchema from basket_types.py for column standardization
-- Remove LiquidityCalculator (liquidity is pre-computed)
-- Implement UniverseFilter that works with TradingSchema
-- Focus on data validation, normalization, and universe construction
-
-**Key Classes to Implement:**
-
-1. **TradingSchemaValidator**:
-   - Validate incoming DataFrames against TradingSchema requirements
-   - Check required columns, data types, value ranges
-   - Generate DataQualityReport with detailed validation results
-   - Handle missing data strategies (drop, fill, warn)
-
-2. **UniverseFilter** (TradingSchema-based):
-   - filter_by_schema(df, schema) -> apply base trading rules
-   - filter_by_liquidity_percentile(df, min_percentile) 
-   - filter_by_sector(df, allowed_sectors)
-   - filter_by_rating_range(df, min_rating, max_rating)
-   - filter_for_similarity(df, reference_isin, criteria) -> similarity constraints
-   - Each method should preserve schema compliance
-
-3. **BondDataProcessor** (main orchestrator):
-   - process_universe(raw_df, trading_schema) -> (clean_df, quality_report)
-   - standardize_to_schema(df, schema) -> apply column mappings and types
-   - validate_universe_quality(df) -> comprehensive data quality checks
-   - enrich_with_derived_features(df) -> add computed columns (rating_category, size_bucket, etc.)
-
-4. **DataQualityReport dataclass**:
-   - Schema compliance metrics
-   - Missing data summary by column
-   - Outlier detection results  
-   - Data type conversion issues
-   - Actionable recommendations for data quality improvement
-
-**Integration Points:**
-- Use BasketInput.universe as the primary data container
-- Leverage TradingSchema for all column name standardization
-- Return processed data in schema-compliant format
-- Generate warnings that integrate with BasketOutput.warnings
-
-**Performance Requirements:**
-- Optimize pandas operations for large datasets (100k+ bonds)
-- Use vectorized operations for all filtering
-- Memory-efficient data processing patterns
-- Lazy evaluation where possible
-
-The module should serve as the data gateway that ensures all downstream basket construction works with clean, schema-compliant data.
+```